@@ -0,0 +1,23 @@
+# Cython declarations for gemcode.py (pure Python mode).
+#
+# gemcode.py stays importable as plain Python; when compiled, this file turns
+# the Lexer and Parser into extension types with C-level attributes and
+# C-dispatched methods. Build in place with:
+#
+#     cythonize -3 -i -a --directive boundscheck=False,wraparound=False gemcode.py
+
+cdef class Lexer:
+    cdef public bytes source_code
+
+    cpdef list tokenize(self)
+
+cdef class Parser:
+    cdef object _tokens
+    cdef public tuple current_token
+    cdef dict _leaves
+
+    cpdef advance(self)
+    cpdef tuple eat(self, str token_type)
+    cpdef statement(self)
+    cpdef parse_expr(self, Py_ssize_t min_prec=*)
+    cpdef factor(self)
@@ -1,167 +1,219 @@
 import sys
 import re
+import ast as python_ast
 import os
+import io
+import math
+import operator
+import concurrent.futures
+
+# Fixed-text tokens, keyed by their source bytes and shared by every occurrence
+_PUNCTUATION_TOKENS = {
+    b'+': ('OPERATOR', '+'),
+    b'-': ('OPERATOR', '-'),
+    b'*': ('OPERATOR', '*'),
+    b'/': ('OPERATOR', '/'),
+    b'==': ('OPERATOR', '=='),
+    b'=': ('ASSIGN', '='),
+    b';': ('SEMICOLON', ';'),
+    b'(': ('LPAREN', '('),
+    b')': ('RPAREN', ')'),
+    b'{': ('LBRACE', '{'),
+    b'}': ('RBRACE', '}'),
+}
+
+# Keyword tokens; like the punctuation tokens above, every occurrence of a
+# keyword shares one tuple instead of allocating its own
+_KEYWORD_TOKENS = {
+    kw.encode('ascii'): ('KEYWORD', kw)
+    for kw in ('print', 'if', 'else', 'while', 'for', 'return', 'int', 'float', 'string')
+}
+
+# Every keyword as one alternation, for the lexer's master regex
+_KEYWORD_PATTERN = b'|'.join(_KEYWORD_TOKENS)
+
+_EOF_TOKEN = ('EOF', None)
 
 class Lexer:
     """
     A lexical analyzer that converts source code into tokens.
+    The source is scanned as UTF-8 bytes; str input is encoded first. Outside
+    string literals the language is ASCII, so only identifiers and strings
+    are ever decoded back to str.
     """
+    # One alternation per token class, tried in order; scanned by the regex
+    # engine so the per-character work stays out of the Python loop. Leading
+    # whitespace is consumed as part of each match rather than as a token of
+    # its own, and END marks the end of the input. Keywords are told apart
+    # from identifiers by the regex too, so ordinary names skip the keyword
+    # table entirely.
+    _MASTER = re.compile(rb'''
+        \s*
+        (?:
+            (?P<KEYWORD>(?:''' + _KEYWORD_PATTERN + rb''')\b)
+          | (?P<IDENTIFIER>[^\W\d]\w*)
+          | (?P<NUMBER>\d+(?P<FRACTION>\.\d+)?)
+          | (?P<STRING>"(?P<STRING_BODY>[^"]*)"?)
+          | (?P<PUNCTUATION>==|[=+\-*/;(){}])
+          | (?P<MISMATCH>.)
+          | (?P<END>\Z)
+        )
+    ''', re.VERBOSE | re.DOTALL)
+
     def __init__(self, source_code):
+        if isinstance(source_code, str):
+            source_code = source_code.encode('utf-8')
         self.source_code = source_code
-        self.position = 0
-        self.current_char = self.source_code[0] if self.source_code else None
-        self.keywords = {'print', 'if', 'else', 'while', 'for', 'return', 'int', 'float', 'string'}
-        
-    def advance(self):
-        """Move to the next character in the source code."""
-        self.position += 1
-        if self.position < len(self.source_code):
-            self.current_char = self.source_code[self.position]
-        else:
-            self.current_char = None
-    
-    def skip_whitespace(self):
-        """Skip whitespace characters."""
-        while self.current_char and self.current_char.isspace():
-            self.advance()
-    
-    def get_identifier(self):
-        """Get an identifier or keyword."""
-        result = ''
-        while self.current_char and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-        
-        if result in self.keywords:
-            return ('KEYWORD', result)
-        else:
-            return ('IDENTIFIER', result)
-    
-    def get_number(self):
-        """Get a numeric literal."""
-        result = ''
-        while self.current_char and (self.current_char.isdigit() or self.current_char == '.'):
-            result += self.current_char
-            self.advance()
-        
-        if '.' in result:
-            return ('FLOAT', float(result))
-        else:
-            return ('INTEGER', int(result))
-    
-    def get_string(self):
-        """Get a string literal."""
-        result = ''
-        # Skip the opening quote
-        self.advance()
-        
-        while self.current_char and self.current_char != '"':
-            result += self.current_char
-            self.advance()
-        
-        # Skip the closing quote
-        if self.current_char == '"':
-            self.advance()
-        
-        return ('STRING', result)
     
     def tokenize(self):
         """Convert the source code into a list of tokens."""
-        tokens = []
-        
-        while self.current_char:
-            if self.current_char.isspace():
-                self.skip_whitespace()
-                continue
-            
-            if self.current_char.isalpha() or self.current_char == '_':
-                tokens.append(self.get_identifier())
-                continue
-            
-            if self.current_char.isdigit():
-                tokens.append(self.get_number())
-                continue
-            
-            if self.current_char == '"':
-                tokens.append(self.get_string())
-                continue
-            
-            if self.current_char == '+':
-                tokens.append(('OPERATOR', '+'))
-                self.advance()
-                continue
-            
-            if self.current_char == '-':
-                tokens.append(('OPERATOR', '-'))
-                self.advance()
-                continue
-            
-            if self.current_char == '*':
-                tokens.append(('OPERATOR', '*'))
-                self.advance()
-                continue
-            
-            if self.current_char == '/':
-                tokens.append(('OPERATOR', '/'))
-                self.advance()
-                continue
+        return list(self.tokens())
+    
+    def tokens(self):
+        """Yield the tokens of the source code one at a time, ending with EOF."""
+        for m in self._MASTER.finditer(self.source_code):
+            kind = m.lastgroup
             
-            if self.current_char == '=':
-                self.advance()
-                if self.current_char == '=':
-                    tokens.append(('OPERATOR', '=='))
-                    self.advance()
+            # Only take a slice of the source for tokens that carry text
+            if kind == 'IDENTIFIER':
+                yield ('IDENTIFIER', sys.intern(m.group(kind).decode('ascii')))
+            elif kind == 'KEYWORD':
+                yield _KEYWORD_TOKENS[m.group(kind)]
+            elif kind == 'NUMBER':
+                # A '.' is only part of the number when a digit follows it
+                if m.group('FRACTION') is None:
+                    yield ('INTEGER', int(m.group(kind)))
                 else:
-                    tokens.append(('ASSIGN', '='))
-                continue
-            
-            if self.current_char == ';':
-                tokens.append(('SEMICOLON', ';'))
-                self.advance()
-                continue
-            
-            if self.current_char == '(':
-                tokens.append(('LPAREN', '('))
-                self.advance()
-                continue
-            
-            if self.current_char == ')':
-                tokens.append(('RPAREN', ')'))
-                self.advance()
-                continue
-            
-            if self.current_char == '{':
-                tokens.append(('LBRACE', '{'))
-                self.advance()
-                continue
-            
-            if self.current_char == '}':
-                tokens.append(('RBRACE', '}'))
-                self.advance()
-                continue
-            
-            # If we get here, we have an unrecognized character
-            raise ValueError(f"Unrecognized character: {self.current_char}")
-        
-        tokens.append(('EOF', None))
-        return tokens
+                    yield ('FLOAT', float(m.group(kind)))
+            elif kind == 'STRING':
+                # The body excludes the quotes; an unterminated string runs to the end of input
+                yield ('STRING', m.group('STRING_BODY').decode('utf-8'))
+            elif kind == 'MISMATCH':
+                # If we get here, we have an unrecognized character; decode
+                # from its start so a multi-byte character is reported whole
+                rest = self.source_code[m.start(kind):m.start(kind) + 4]
+                raise ValueError(f"Unrecognized character: {rest.decode('utf-8', 'replace')[0]}")
+            elif kind == 'END':
+                break
+            else:
+                yield _PUNCTUATION_TOKENS[m.group(kind)]
+        
+        yield _EOF_TOKEN
+
+class Node:
+    """
+    Base class for AST nodes. Each node type lists its fields in __slots__,
+    which keeps nodes far smaller than the equivalent dicts.
+    """
+    __slots__ = ()
+    
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class Program(Node):
+    """Program -> Statement*"""
+    __slots__ = ('body',)
+    
+    def __init__(self, body):
+        self.body = body
+
+class PrintStatement(Node):
+    """PrintStatement -> 'print' Expression ';'"""
+    __slots__ = ('expression',)
+    
+    def __init__(self, expression):
+        self.expression = expression
+
+class AssignmentStatement(Node):
+    """AssignmentStatement -> Identifier '=' Expression ';'"""
+    __slots__ = ('name', 'value')
+    
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+class Block(Node):
+    """Block -> '{' Statement* '}'"""
+    __slots__ = ('body',)
+    
+    def __init__(self, body):
+        self.body = body
+
+class BinaryExpression(Node):
+    """BinaryExpression -> Expression Operator Expression"""
+    __slots__ = ('operator', 'left', 'right')
+    
+    def __init__(self, operator, left, right):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+class Literal(Node):
+    """Literal -> INTEGER | FLOAT | STRING"""
+    __slots__ = ('value', 'data_type')
+    
+    def __init__(self, value, data_type):
+        self.value = value
+        self.data_type = data_type
+
+class Identifier(Node):
+    """Identifier -> IDENTIFIER"""
+    __slots__ = ('name',)
+    
+    def __init__(self, name):
+        self.name = name
+
+# Binding strength of the binary operators; higher binds tighter
+_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2}
+
+# Literal token kinds and the data type of the Literal node they produce
+_LITERAL_TYPES = {'INTEGER': 'int', 'FLOAT': 'float', 'STRING': 'string'}
+
+# Operators evaluated at compile time when both operands are numeric literals
+_CONSTANT_OPERATORS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv}
+_NUMERIC_TYPES = frozenset(('int', 'float'))
+
+# Folded ints wider than this stay as expressions, well below the digit
+# limit that str() enforces when the literal is written back out
+_MAX_FOLDED_INT_BITS = 1024
+
+def _fold_constants(op, left, right):
+    """Return a Literal for `left op right` if both are numeric literals, else None."""
+    if not (isinstance(left, Literal) and isinstance(right, Literal)):
+        return None
+    if left.data_type not in _NUMERIC_TYPES or right.data_type not in _NUMERIC_TYPES:
+        return None
+    
+    try:
+        value = _CONSTANT_OPERATORS[op](left.value, right.value)
+    except ArithmeticError:
+        # Division by zero or float overflow; leave it to the generated code
+        return None
+    
+    if isinstance(value, float) and not math.isfinite(value):
+        # inf and nan have no literal spelling in the generated code
+        return None
+    if isinstance(value, int) and value.bit_length() > _MAX_FOLDED_INT_BITS:
+        return None
+    
+    return Literal(value, 'float' if isinstance(value, float) else 'int')
 
 class Parser:
     """
     A parser that converts tokens into an abstract syntax tree (AST).
+    Tokens may come from any iterable, such as the generator returned by
+    Lexer.tokens(); they are consumed one at a time.
     """
     def __init__(self, tokens):
-        self.tokens = tokens
-        self.position = 0
-        self.current_token = self.tokens[0]
+        self._tokens = iter(tokens)
+        self.current_token = next(self._tokens, _EOF_TOKEN)
+        # Literal and Identifier nodes built so far, keyed by their token
+        self._leaves = {}
     
     def advance(self):
         """Move to the next token."""
-        self.position += 1
-        if self.position < len(self.tokens):
-            self.current_token = self.tokens[self.position]
-        else:
-            self.current_token = None
+        self.current_token = next(self._tokens, _EOF_TOKEN)
     
     def eat(self, token_type):
         """Consume a token of the expected type."""
@@ -179,174 +231,200 @@ class Parser:
     def program(self):
         """Program -> Statement*"""
         statements = []
+        statement = self.statement
         
         while self.current_token[0] != 'EOF':
-            statements.append(self.statement())
+            statements.append(statement())
         
-        return {'type': 'Program', 'body': statements}
+        return Program(statements)
     
     def statement(self):
         """Statement -> PrintStatement | AssignmentStatement | Block"""
-        if self.current_token[0] == 'KEYWORD' and self.current_token[1] == 'print':
+        token = self.current_token
+        
+        if token[0] == 'KEYWORD' and token[1] == 'print':
             return self.print_statement()
-        elif self.current_token[0] == 'IDENTIFIER':
+        elif token[0] == 'IDENTIFIER':
             return self.assignment_statement()
-        elif self.current_token[0] == 'LBRACE':
+        elif token[0] == 'LBRACE':
             return self.block()
         else:
-            raise SyntaxError(f"Unexpected token: {self.current_token}")
+            raise SyntaxError(f"Unexpected token: {token}")
     
     def print_statement(self):
         """PrintStatement -> 'print' Expression ';'"""
         self.eat('KEYWORD')  # Consume 'print'
         self.eat('LPAREN')
-        expr = self.expression()
+        expr = self.parse_expr()
         self.eat('RPAREN')
         self.eat('SEMICOLON')
         
-        return {'type': 'PrintStatement', 'expression': expr}
+        return PrintStatement(expr)
     
     def assignment_statement(self):
         """AssignmentStatement -> Identifier '=' Expression ';'"""
         identifier = self.eat('IDENTIFIER')
         self.eat('ASSIGN')
-        expr = self.expression()
+        expr = self.parse_expr()
         self.eat('SEMICOLON')
         
-        return {'type': 'AssignmentStatement', 'name': identifier[1], 'value': expr}
+        return AssignmentStatement(identifier[1], expr)
     
     def block(self):
         """Block -> '{' Statement* '}'"""
         self.eat('LBRACE')
         statements = []
+        statement = self.statement
         
         while self.current_token[0] != 'RBRACE':
-            statements.append(self.statement())
+            statements.append(statement())
         
         self.eat('RBRACE')
         
-        return {'type': 'Block', 'body': statements}
-    
-    def expression(self):
-        """Expression -> Term (('+' | '-') Term)*"""
-        node = self.term()
-        
-        while self.current_token[0] == 'OPERATOR' and self.current_token[1] in ('+', '-'):
-            op = self.eat('OPERATOR')
-            right = self.term()
-            node = {'type': 'BinaryExpression', 'operator': op[1], 'left': node, 'right': right}
-        
-        return node
+        return Block(statements)
     
-    def term(self):
-        """Term -> Factor (('*' | '/') Factor)*"""
-        node = self.factor()
+    def parse_expr(self, min_prec=1):
+        """Expression -> Factor (Operator Factor)*, grouped by operator precedence"""
+        left = self.factor()
+        # The current token only changes when an operator is consumed
+        token = self.current_token
         
-        while self.current_token[0] == 'OPERATOR' and self.current_token[1] in ('*', '/'):
-            op = self.eat('OPERATOR')
-            right = self.factor()
-            node = {'type': 'BinaryExpression', 'operator': op[1], 'left': node, 'right': right}
+        while token[0] == 'OPERATOR':
+            prec = _PRECEDENCE.get(token[1], 0)
+            if prec < min_prec:
+                break
+            
+            self.advance()
+            right = self.parse_expr(prec + 1)
+            folded = _fold_constants(token[1], left, right)
+            left = BinaryExpression(token[1], left, right) if folded is None else folded
+            token = self.current_token
         
-        return node
+        return left
     
     def factor(self):
         """Factor -> INTEGER | FLOAT | STRING | IDENTIFIER | '(' Expression ')'"""
         token = self.current_token
         
-        if token[0] == 'INTEGER':
-            self.eat('INTEGER')
-            return {'type': 'Literal', 'value': token[1], 'dataType': 'int'}
-        
-        elif token[0] == 'FLOAT':
-            self.eat('FLOAT')
-            return {'type': 'Literal', 'value': token[1], 'dataType': 'float'}
+        # Leaf nodes are never modified, so repeats of a token share one node
+        node = self._leaves.get(token)
+        if node is not None:
+            self.advance()
+            return node
         
-        elif token[0] == 'STRING':
-            self.eat('STRING')
-            return {'type': 'Literal', 'value': token[1], 'dataType': 'string'}
+        data_type = _LITERAL_TYPES.get(token[0])
+        if data_type is not None:
+            self.advance()
+            node = Literal(token[1], data_type)
         
         elif token[0] == 'IDENTIFIER':
-            self.eat('IDENTIFIER')
-            return {'type': 'Identifier', 'name': token[1]}
+            self.advance()
+            node = Identifier(token[1])
         
         elif token[0] == 'LPAREN':
             self.eat('LPAREN')
-            expr = self.expression()
+            expr = self.parse_expr()
             self.eat('RPAREN')
             return expr
         
         else:
             raise SyntaxError(f"Unexpected token: {token}")
+        
+        self._leaves[token] = node
+        return node
 
-class CodeGenerator:
+class NodeVisitor:
     """
-    A code generator that converts an AST into executable code.
-    In this simple implementation, we'll generate Python code.
+    Base class for AST visitors. Each node is dispatched to the
+    visit_<NodeClass> method for its class, or to generic_visit if the
+    subclass defines none.
     """
     def __init__(self, ast):
         self.ast = ast
-        self.output = []
-        self.indent_level = 0
-    
-    def indent(self):
-        """Add indentation to the output."""
-        return '    ' * self.indent_level
-    
-    def generate(self):
-        """Generate code from the AST."""
-        self.visit(self.ast)
-        return '\n'.join(self.output)
+        # Bound visitors by node class, so visit() is a single dict lookup
+        self._visitors = {}
+        for node_class in Node.__subclasses__():
+            visitor = getattr(self, f"visit_{node_class.__name__}", None)
+            if visitor is not None:
+                self._visitors[node_class] = visitor
     
     def visit(self, node):
         """Visit a node in the AST."""
-        method_name = f"visit_{node['type']}"
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        return self._visitors.get(type(node), self.generic_visit)(node)
     
     def generic_visit(self, node):
         """Generic visitor for any node without a specific visitor."""
-        raise NotImplementedError(f"No visit method for {node['type']}")
+        raise NotImplementedError(f"No visit method for {type(node).__name__}")
+
+# Indentation strings for the common block levels. Read-only, so the
+# CodeGenerators that main_batch may run in threads can share it safely
+_INDENTS = tuple('    ' * level for level in range(16))
+
+class CodeGenerator(NodeVisitor):
+    """
+    A code generator that converts an AST into executable code.
+    In this simple implementation, we'll generate Python code.
+    Code is written to the given sink (any file-like object) as it is
+    generated, or collected in memory when no sink is given.
+    """
+    def __init__(self, ast, sink=None):
+        super().__init__(ast)
+        self.output = io.StringIO() if sink is None else sink
+        self._streaming = sink is not None
+        self.indent_level = 0
+    
+    def indent(self):
+        """Return the indentation for the current block level."""
+        level = self.indent_level
+        return _INDENTS[level] if level < len(_INDENTS) else '    ' * level
+    
+    def generate(self):
+        """Generate code from the AST; returns it as a string unless it went to a sink."""
+        self.visit(self.ast)
+        if self._streaming:
+            return None
+        return self.output.getvalue()
     
     def visit_Program(self, node):
         """Visit a Program node."""
-        self.output.append("# Generated by SimpleCompiler")
-        self.output.append("")
+        # Every statement starts its own line, so the header is followed by a blank line
+        self.output.write("# Generated by SimpleCompiler\n")
         
-        for statement in node['body']:
+        for statement in node.body:
             self.visit(statement)
     
     def visit_PrintStatement(self, node):
         """Visit a PrintStatement node."""
-        expr = self.visit(node['expression'])
-        self.output.append(f"{self.indent()}print({expr})")
+        expr = self.visit(node.expression)
+        self.output.write(f"\n{self.indent()}print({expr})")
     
     def visit_AssignmentStatement(self, node):
         """Visit an AssignmentStatement node."""
-        name = node['name']
-        value = self.visit(node['value'])
-        self.output.append(f"{self.indent()}{name} = {value}")
+        name = node.name
+        value = self.visit(node.value)
+        self.output.write(f"\n{self.indent()}{name} = {value}")
     
     def visit_Block(self, node):
         """Visit a Block node."""
         self.indent_level += 1
         
-        for statement in node['body']:
+        for statement in node.body:
             self.visit(statement)
         
         self.indent_level -= 1
     
     def visit_BinaryExpression(self, node):
         """Visit a BinaryExpression node."""
-        left = self.visit(node['left'])
-        right = self.visit(node['right'])
-        operator = node['operator']
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        operator = node.operator
         
         return f"({left} {operator} {right})"
     
     def visit_Literal(self, node):
         """Visit a Literal node."""
-        value = node['value']
-        data_type = node['dataType']
+        value = node.value
+        data_type = node.data_type
         
         if data_type == 'string':
             return f'"{value}"'
@@ -355,7 +433,68 @@ class CodeGenerator:
     
     def visit_Identifier(self, node):
         """Visit an Identifier node."""
-        return node['name']
+        return node.name
+
+# Python AST operator classes for the binary operators
+_PYTHON_OPERATORS = {'+': python_ast.Add, '-': python_ast.Sub, '*': python_ast.Mult, '/': python_ast.Div}
+
+class PythonASTGenerator(NodeVisitor):
+    """
+    A code generator that converts an AST into a Python ast.Module, which can
+    be passed to compile() directly without producing source text first.
+    Statements inside a Block are emitted in place, as Python has no block scope.
+    """
+    def generate(self):
+        """Generate a Python module AST, with locations filled in."""
+        return python_ast.fix_missing_locations(self.visit(self.ast))
+    
+    def visit_statements(self, statements):
+        """Visit a list of statements, returning a flat list of Python statements."""
+        body = []
+        for statement in statements:
+            body.extend(self.visit(statement))
+        return body
+    
+    def visit_Program(self, node):
+        """Visit a Program node."""
+        return python_ast.Module(body=self.visit_statements(node.body), type_ignores=[])
+    
+    def visit_PrintStatement(self, node):
+        """Visit a PrintStatement node."""
+        call = python_ast.Call(
+            func=python_ast.Name(id='print', ctx=python_ast.Load()),
+            args=[self.visit(node.expression)],
+            keywords=[],
+        )
+        return [python_ast.Expr(value=call)]
+    
+    def visit_AssignmentStatement(self, node):
+        """Visit an AssignmentStatement node."""
+        target = python_ast.Name(id=node.name, ctx=python_ast.Store())
+        return [python_ast.Assign(targets=[target], value=self.visit(node.value))]
+    
+    def visit_Block(self, node):
+        """Visit a Block node."""
+        return self.visit_statements(node.body)
+    
+    def visit_BinaryExpression(self, node):
+        """Visit a BinaryExpression node."""
+        return python_ast.BinOp(
+            left=self.visit(node.left),
+            op=_PYTHON_OPERATORS[node.operator](),
+            right=self.visit(node.right),
+        )
+    
+    def visit_Literal(self, node):
+        """Visit a Literal node."""
+        if node.data_type == 'string':
+            # Read escapes exactly as CodeGenerator's "..." spelling would be read
+            return python_ast.Constant(value=python_ast.literal_eval(f'"{node.value}"'))
+        return python_ast.Constant(value=node.value)
+    
+    def visit_Identifier(self, node):
+        """Visit an Identifier node."""
+        return python_ast.Name(id=node.name, ctx=python_ast.Load())
 
 class Compiler:
     """
@@ -364,36 +503,121 @@ class Compiler:
     def __init__(self):
         pass
     
-    def compile(self, source_code, output_file=None):
-        """Compile the source code."""
-        # Lexical analysis
+    def parse(self, source_code):
+        """Lex and parse the source code into an AST."""
+        # Tokens are handed to the parser as they are scanned
         lexer = Lexer(source_code)
-        tokens = lexer.tokenize()
-        
-        # Parsing
-        parser = Parser(tokens)
-        ast = parser.parse()
-        
-        # Code generation
-        code_generator = CodeGenerator(ast)
-        target_code = code_generator.generate()
+        parser = Parser(lexer.tokens())
+        return parser.parse()
+    
+    def compile(self, source_code, output_file=None):
+        """Compile the source code; returns the target code unless it was written to output_file."""
+        ast = self.parse(source_code)
         
+        # Code generation, streamed straight into the output file if there is one
         if output_file:
-            with open(output_file, 'w') as f:
-                f.write(target_code)
+            with open(output_file, 'w', buffering=1 << 16) as f:
+                CodeGenerator(ast, sink=f).generate()
+            return None
         
-        return target_code
+        code_generator = CodeGenerator(ast)
+        return code_generator.generate()
+    
+    def compile_and_run(self, source_code, namespace=None):
+        """Compile the source code to a Python code object and run it; returns the namespace it ran in."""
+        module = PythonASTGenerator(self.parse(source_code)).generate()
+        code = compile(module, '<gem>', 'exec')
+        
+        if namespace is None:
+            namespace = {}
+        exec(code, namespace)
+        return namespace
+
+def batch_output_file(source_file):
+    """Return the .py path that compile_file writes for a source file."""
+    return os.path.splitext(source_file)[0] + '.py'
+
+def compile_file(source_file):
+    """Compile a source file into a .py file next to it; returns the output path."""
+    output_file = batch_output_file(source_file)
+    # Compare as the filesystem does: FOO.PY and FOO.py may be one file
+    # on a case-insensitive filesystem, as may hard or symbolic links
+    same_path = os.path.normcase(os.path.abspath(output_file)) == os.path.normcase(os.path.abspath(source_file))
+    if same_path or (os.path.exists(output_file) and os.path.samefile(output_file, source_file)):
+        raise ValueError(f"Output would overwrite the source file '{source_file}'")
+    
+    with open(source_file, 'rb') as f:
+        source_code = f.read()
+    
+    Compiler().compile(source_code, output_file)
+    return output_file
+
+def main_batch(source_files):
+    """Compile several independent source files in parallel; returns the number that failed."""
+    # Free-threaded builds run threads in parallel, which saves starting
+    # and feeding worker processes; otherwise use one process per core
+    if getattr(sys, '_is_gil_enabled', lambda: True)():
+        executor_class = concurrent.futures.ProcessPoolExecutor
+    else:
+        executor_class = concurrent.futures.ThreadPoolExecutor
+    
+    # The same file given twice (a.gem ./a.gem) is compiled once
+    unique_files = {}
+    for source_file in source_files:
+        unique_files.setdefault(os.path.realpath(source_file), source_file)
+    source_files = list(unique_files.values())
+    
+    # Different files that would write the same output (foo.gem and
+    # foo.txt) are reported instead of racing each other for it
+    by_output = {}
+    for source_file in source_files:
+        output_file = os.path.realpath(batch_output_file(source_file))
+        by_output.setdefault(output_file, []).append(source_file)
+    
+    failures = 0
+    with executor_class(max_workers=os.cpu_count()) as executor:
+        futures = {}
+        for sharing in by_output.values():
+            if len(sharing) == 1:
+                futures[sharing[0]] = executor.submit(compile_file, sharing[0])
+        
+        for source_file in source_files:
+            output_file = os.path.realpath(batch_output_file(source_file))
+            sharing = by_output[output_file]
+            if len(sharing) > 1:
+                others = [f for f in sharing if f != source_file]
+                print(f"{source_file}: Compilation error: Output file '{output_file}' "
+                      f"is also written by {', '.join(others)}")
+                failures += 1
+                continue
+            
+            try:
+                print(f"{source_file}: Output written to {futures[source_file].result()}")
+            except FileNotFoundError:
+                print(f"{source_file}: Error: File not found.")
+                failures += 1
+            except Exception as e:
+                print(f"{source_file}: Compilation error: {e}")
+                failures += 1
+    
+    return failures
 
 def main():
-    if len(sys.argv) < 2:
+    if len(sys.argv) < 2 or sys.argv[1:] == ['--batch']:
         print("Usage: python compiler.py <source_file> [output_file]")
+        print("       python compiler.py --batch <source_file>...")
+        return
+    
+    if sys.argv[1] == '--batch':
+        if main_batch(sys.argv[2:]):
+            sys.exit(1)
         return
     
     source_file = sys.argv[1]
     output_file = sys.argv[2] if len(sys.argv) > 2 else None
     
     try:
-        with open(source_file, 'r') as f:
+        with open(source_file, 'rb') as f:
             source_code = f.read()
         
         compiler = Compiler()
@@ -0,0 +1,165 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import gemcode
+
+
+def compile_source(source_code):
+    return gemcode.Compiler().compile(source_code)
+
+
+def tokenize(source_code):
+    return gemcode.Lexer(source_code).tokenize()[:-1]
+
+
+class NumberLexingTest(unittest.TestCase):
+    def test_integer(self):
+        self.assertEqual(tokenize("12"), [('INTEGER', 12)])
+
+    def test_float(self):
+        self.assertEqual(tokenize("1.5"), [('FLOAT', 1.5)])
+
+    def test_stray_dots_are_rejected(self):
+        for source_code in ("1.", "1..2", "1.2.3"):
+            with self.subTest(source_code=source_code):
+                with self.assertRaisesRegex(ValueError, r"Unrecognized character: \."):
+                    tokenize(source_code)
+
+
+class KeywordLexingTest(unittest.TestCase):
+    def test_keywords(self):
+        for name in ("print", "if", "int"):
+            with self.subTest(name=name):
+                self.assertEqual(tokenize(name), [('KEYWORD', name)])
+
+    def test_names_starting_with_a_keyword_are_identifiers(self):
+        for name in ("printx", "int_", "format", "if2"):
+            with self.subTest(name=name):
+                self.assertEqual(tokenize(name), [('IDENTIFIER', name)])
+
+
+class ConstantFoldingTest(unittest.TestCase):
+    def test_folds_numeric_literals(self):
+        self.assertTrue(compile_source("x = 10 + 20 * 3;").endswith("x = 70"))
+
+    def test_division_by_zero_is_not_folded(self):
+        self.assertTrue(compile_source("x = 1 / 0;").endswith("x = (1 / 0)"))
+
+    def test_int_too_large_for_float_division_is_not_folded(self):
+        big = "1" + "0" * 400
+        self.assertTrue(compile_source(f"print({big} / 1);").endswith(f"print(({big} / 1))"))
+
+    def test_int_too_large_for_float_multiplication_is_not_folded(self):
+        big = "1" + "0" * 400
+        self.assertTrue(compile_source(f"print({big} * 1.5);").endswith(f"print(({big} * 1.5))"))
+
+    def test_int_result_too_large_to_print_is_not_folded(self):
+        big = "9" * 3000
+        self.assertTrue(compile_source(f"x = {big} * {big};").endswith(f"x = ({big} * {big})"))
+
+
+class IndentationTest(unittest.TestCase):
+    def test_blocks_are_indented_by_level(self):
+        for depth in (1, 6, len(gemcode._INDENTS) + 2):
+            source_code = "{" * depth + "x = 1;" + "}" * depth
+            self.assertTrue(compile_source(source_code).endswith("\n" + "    " * depth + "x = 1"))
+
+    def test_indent_table_is_not_modified(self):
+        indents = gemcode._INDENTS
+        compile_source("{" * 40 + "x = 1;" + "}" * 40)
+        self.assertIs(gemcode._INDENTS, indents)
+        self.assertIsInstance(indents, tuple)
+
+
+class NodeVisitorTest(unittest.TestCase):
+    def test_dispatches_by_method_name(self):
+        class NameCollector(gemcode.NodeVisitor):
+            def visit_Identifier(self, node):
+                return node.name
+
+        collector = NameCollector(None)
+        self.assertEqual(collector.visit(gemcode.Identifier("x")), "x")
+        with self.assertRaises(NotImplementedError):
+            collector.visit(gemcode.Literal(1, "int"))
+
+
+class CompileAndRunTest(unittest.TestCase):
+    def test_matches_generated_source(self):
+        source_code = r'x = 2; y = x * 3 + 0.5; print(y); print("a\nb\t\u00e9"); print(1 + 2);'
+
+        generated = io.StringIO()
+        with contextlib.redirect_stdout(generated):
+            exec(compile_source(source_code), {})
+
+        in_process = io.StringIO()
+        with contextlib.redirect_stdout(in_process):
+            gemcode.Compiler().compile_and_run(source_code)
+
+        self.assertEqual(in_process.getvalue(), generated.getvalue())
+        self.assertIn("a\nb\t\u00e9", in_process.getvalue())
+
+
+class BatchTest(unittest.TestCase):
+    def test_files_sharing_an_output_are_not_compiled(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source_files = [os.path.join(tmp, name) for name in ("foo.gem", "foo.txt", "bar.gem")]
+            for source_file in source_files:
+                with open(source_file, "w") as f:
+                    f.write("x = 1;")
+
+            report = io.StringIO()
+            with contextlib.redirect_stdout(report):
+                failures = gemcode.main_batch(source_files)
+
+            self.assertEqual(failures, 2)
+            self.assertEqual(report.getvalue().count("is also written by"), 2)
+            self.assertFalse(os.path.exists(os.path.join(tmp, "foo.py")))
+            self.assertTrue(os.path.exists(os.path.join(tmp, "bar.py")))
+
+    def test_same_file_given_twice_is_compiled_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source_file = os.path.join(tmp, "a.gem")
+            with open(source_file, "w") as f:
+                f.write("x = 1;")
+
+            report = io.StringIO()
+            with contextlib.redirect_stdout(report):
+                failures = gemcode.main_batch([source_file, os.path.join(tmp, ".", "a.gem")])
+
+            self.assertEqual(failures, 0)
+
+            self.assertEqual(report.getvalue(), f"{source_file}: Output written to {os.path.join(tmp, 'a.py')}\n")
+
+
+    def test_missing_file_is_reported_with_its_name(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source_file = os.path.join(tmp, "missing.gem")
+
+            report = io.StringIO()
+            with contextlib.redirect_stdout(report):
+                failures = gemcode.main_batch([source_file])
+
+            self.assertEqual(failures, 1)
+            self.assertEqual(report.getvalue(), f"{source_file}: Error: File not found.\n")
+
+
+class CompileFileTest(unittest.TestCase):
+    def test_refuses_to_overwrite_source_through_another_name(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source_file = os.path.join(tmp, "a.gem")
+            with open(source_file, "w") as f:
+                f.write("x = 1;")
+            # a.py is the same file as a.gem, as FOO.py is FOO.PY on a case-insensitive filesystem
+            os.link(source_file, os.path.join(tmp, "a.py"))
+
+            with self.assertRaises(ValueError):
+                gemcode.compile_file(source_file)
+            with open(source_file) as f:
+                self.assertEqual(f.read(), "x = 1;")
+
+
+if __name__ == "__main__":
+    unittest.main()